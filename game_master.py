@@ -16,14 +16,13 @@ class GameMaster:
         theme_path = f"assets/themes/{theme_name}"
         loader = ThemeLoader(theme_path)
         
-        self.story = loader.load_story()
-        self.state = world.load_world_from_theme(loader)
+        self.state, self.story, trigger_data = loader.load_all()
         
         # Systems
         self.logger = NarrativeLogger()
         self.memory = MemoryManager()
         self.events = EventManager()
-        self.events.load_triggers(loader.load_events())
+        self.events.load_triggers(trigger_data)
 
         # Global Pacing
         self.global_turn_count = 0
@@ -210,6 +210,8 @@ SCRIPTS = {
 
 import json
 import os
+from pathlib import Path
+from jsonshim import loads
 
 # World and plot summary for the AI (injected into the prompt after Script 12).
 GAME_WORLD_SUMMARY = """
@@ -227,8 +229,7 @@ def format_system_prompt(memory_path="saves/memory.json"):
     if not os.path.exists(memory_path):
         return "<|start_header_id|>system<|end_header_id|>\n\nMemory file not found. Assume default start."
 
-    with open(memory_path, "r") as f:
-        memory = json.load(f)
+    memory = loads(Path(memory_path).read_bytes())
 
     stats = memory.get("player_state", {})
     hp = stats.get("hp", 100)
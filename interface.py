@@ -1,6 +1,9 @@
 import pygame
 import pygame_gui
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import random
 from pygame_gui.elements import UIPanel, UITextBox, UIButton, UITextEntryLine, UILabel
 from pygame_gui.core import ObjectID
 from typing import List, Optional, Dict
@@ -12,9 +15,60 @@ HUD_HEIGHT = 60
 DIALOGUE_HEIGHT = 350  # Expanded for professional VN feel (~48% of 720px)
 LOG_WIDTH = 320        # Approx 25% of 1280
 FPS = 60
+IDLE_UPDATE_INTERVAL = 0.1  # Seconds between UI ticks while nothing is animating
+SENTENCES_PER_CHUNK = 3     # Narrative sentences shown per dialogue chunk
+IDLE_WAIT_MS = 50           # Max time to block for input while waiting on the player (~20 FPS)
+LOG_MAX_ENTRIES = 50        # Story Log keeps only the most recent entries
+LOG_HEADER = "<b>STORY LOG</b>"
+MIXER_BUFFER = 1024         # Audio samples per buffer (~23 ms at 44.1 kHz)
+TYPE_TIME_PER_LETTER = 0.05 # Typewriter reveal speed in seconds per visible character
+NOTE_RISE_SPEED = 60.0      # Floating notification drift in px/s
+NOTE_HEIGHT = 60
+
+# --- Text Normalization ---
+AI_TAKEOVER_RE = re.compile(r'\[AI TAKEOVER:.*?\]')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+SENTENCE_RE = re.compile(r'[^.!?]+[.!?]["”\']?|[^.!?]+$')
+# Smart quotes/symbols folded to ASCII in a single translate() pass
+ASCII_FOLD = str.maketrans({'“': '"', '”': '"', '‘': "'", '’': "'", '—': '--', '…': '...'})
+
+# --- Static Link Markup ---
+# Stylized Custom Action link with soft teal color and italics
+CUSTOM_ACTION_LINK = (
+    '<br><br>'
+    '<a href="CUSTOM_TRIGGER">'
+    '<font color="#80acaa"><i>> Take Custom Action (Free type)</i></font>'
+    '</a>'
+)
+END_LINKS = (
+    '<br><br><br>'
+    '<font color="#ff0055">'
+    '<a href="RETRY">RETRY SESSION</a>'
+    '</font>'
+    '<br><br>'
+    '<a href="QUIT">QUIT TO DESKTOP</a>'
+)
+
+def _load_scaled_image(image_path: str) -> pygame.Surface:
+    """Loads an image and scales it to the window. Safe to run off the main thread."""
+    return pygame.transform.scale(pygame.image.load(image_path), (WIDTH, HEIGHT))
 
 class VisualNovelUI:
+    # HUD label key, display prefix and Player attribute for each stat
+    _HUD_FIELDS = (
+        ("hp", "HP", "hp"),
+        ("mana", "Mana", "mana"),
+        ("bullets", "Bullets", "bullet"),
+        ("credits", "Credits", "credits"),
+    )
+
+    # Spawn origin for floating notifications (centre of the play area)
+    _NOTE_CENTER_X = (WIDTH - LOG_WIDTH) // 2
+    _NOTE_CENTER_Y = HEIGHT // 2
+
     def __init__(self, theme_path: str = "assets/themes/theme.json"):
+        # Must precede pygame.init(), which brings the mixer up with SDL defaults
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Iron Skeleton - Neuro-Symbolic Engine")
@@ -31,27 +85,61 @@ class VisualNovelUI:
 
         self.clock = pygame.time.Clock()
         
-        self.background_image: Optional[pygame.Surface] = None
+        # Scaled backgrounds by path (None marks a path that failed to load)
+        self._bg_cache: Dict[str, Optional[pygame.Surface]] = {}
+        # Backgrounds being decoded/scaled in the background ahead of first use
+        self._bg_executor = ThreadPoolExecutor(max_workers=1)
+        self._bg_futures: Dict[str, Future] = {}
         self.current_bg_path: str = ""
         
         # UI Elements
         self.hud_panel: Optional[UIPanel] = None
         self.stat_labels: Dict[str, UILabel] = {}
+        # Last value shown per HUD label, so unchanged stats are not re-rendered
+        self._hud_cache: Dict[str, int] = {key: -1 for key, _, _ in self._HUD_FIELDS}
         self.log_box: Optional[UITextBox] = None
         self.dialogue_box: Optional[UITextBox] = None
         self.custom_action_input: Optional[UITextEntryLine] = None
         
+        # Floating notes with their positions kept alongside (parallel lists),
+        # so the widgets are only moved when they cross a whole pixel
         self.floating_notes: List[UITextBox] = []
-        self.story_history: str = "<b>STORY LOG</b>"
+        self._note_x: List[int] = []
+        self._note_y: List[float] = []
+        # Story Log entries as HTML fragments, bounded so each re-parse stays small
+        self._log_frags: deque = deque(maxlen=LOG_MAX_ENTRIES)
+        self._log_box_text: str = ""
+        # Appends only mark the log; handle_events pushes it to the box once per frame
+        self._log_dirty: bool = False
         
         # Narrative State
         self.full_narrative: str = ""
         self.text_chunks: List[str] = []
         self.current_chunk_idx: int = 0
         self.is_typing: bool = False
+        # Typewriter state: cut points in the current chunk that never split a tag or entity
+        self._type_breaks: List[int] = []
+        self._type_pos: int = 0
+        self._type_accum: float = 0.0
         
         self.selected_choice: Optional[str] = None
         
+        # Event type -> handler returning an optional loop signal
+        self._event_handlers = {
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame_gui.UI_TEXT_EFFECT_FINISHED: self._on_text_effect_finished,
+            pygame_gui.UI_TEXT_BOX_LINK_CLICKED: self._on_link_clicked,
+            pygame_gui.UI_TEXT_ENTRY_FINISHED: self._on_text_entry_finished,
+        }
+        # Event types pulled from the queue for full routing; everything else only feeds the manager
+        self._routed_event_types = [pygame.QUIT, *self._event_handlers]
+        
+        # Set whenever the UI may look different from the last presented frame
+        self._ui_dirty: bool = True
+        
+        # Time banked while the UI is idle and manager ticks are skipped
+        self._idle_accum: float = 0.0
+        
         self._setup_layout()
 
     def _setup_layout(self):
@@ -81,6 +169,8 @@ class VisualNovelUI:
             manager=self.manager,
             object_id=ObjectID(class_id="@log_box")
         )
+        # Layout is static, so the hit-test rect is captured once
+        self._log_rect = self.log_box.get_relative_rect().copy()
 
         # 3. Expanded Dialogue Box (Bottom Anchor)
         # Positioned with a 20px padding from the bottom and sides
@@ -95,21 +185,31 @@ class VisualNovelUI:
             manager=self.manager
         )
 
+        # 4. Custom Action Entry (created once, shown on demand above the dialogue box)
+        self.custom_action_input = UITextEntryLine(
+            relative_rect=pygame.Rect(100, HEIGHT - DIALOGUE_HEIGHT - 90, 600, 50),
+            manager=self.manager
+        )
+        self.custom_action_input.hide()
+
     def update_hud(self, player: Player):
-        self.stat_labels["hp"].set_text(f"HP: {player.hp}")
-        self.stat_labels["mana"].set_text(f"Mana: {player.mana}")
-        self.stat_labels["bullets"].set_text(f"Bullets: {player.bullet}")
-        self.stat_labels["credits"].set_text(f"Credits: {player.credits}")
+        for key, prefix, attr in self._HUD_FIELDS:
+            value = getattr(player, attr)
+            if value != self._hud_cache[key]:
+                self.stat_labels[key].set_text(f"{prefix}: {value}")
+                self._hud_cache[key] = value
+                self._ui_dirty = True
 
     def play_bgm(self, music_path: str, loops: int = -1):
         """Starts background music playback."""
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
         try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
             pygame.mixer.music.load(music_path)
-            pygame.mixer.music.play(loops)
-        except Exception as e:
+        except (pygame.error, OSError) as e:
             print(f"Error playing music {music_path}: {e}")
+            return
+        pygame.mixer.music.play(loops)
 
     def stop_bgm(self):
         """Stops background music playback."""
@@ -118,7 +218,6 @@ class VisualNovelUI:
 
     def clear_ui(self):
         """Wipes the UI elements clean for a fresh session."""
-        self.dialogue_box.set_active_effect(None)
         self.dialogue_box.set_text("")
         
         self.full_narrative = ""
@@ -126,26 +225,26 @@ class VisualNovelUI:
         self.current_chunk_idx = 0
         self.is_typing = False
         
-        self.story_history = "<b>STORY LOG</b>"
-        self.log_box.set_text(self.story_history)
+        self._log_frags.clear()
+        self._log_dirty = True
         
         self.clear_options()
-        for note in self.floating_notes[:]:
+        for note in self.floating_notes:
             note.kill()
         self.floating_notes.clear()
+        self._note_x.clear()
+        self._note_y.clear()
+        self._ui_dirty = True
 
     def show_message(self, text: str):
         """Splits narrative into chunks and displays the first. Also logs to Story Log."""
         # BUGFIX: Aggressive ASCII Normalization
         # Standardize whitespace and convert smart quotes/symbols to ASCII.
-        # This ensures the typewriter mask matches the rendered text length perfectly.
-        text = " ".join(text.split())
-        text = text.replace('“', '"').replace('”', '"').replace('‘', "'").replace('’', "'")
-        text = text.replace('—', '--').replace('…', '...')
+        text = " ".join(text.split()).translate(ASCII_FOLD)
         text = text.encode("ascii", "ignore").decode("ascii")
         
         # HIDDEN COMMANDS: Strip [AI TAKEOVER: ...] tags
-        text = re.sub(r'\[AI TAKEOVER:.*?\]', '', text)
+        text = AI_TAKEOVER_RE.sub('', text)
         
         if text == self.full_narrative:
             return
@@ -155,78 +254,85 @@ class VisualNovelUI:
         self.current_chunk_idx = 0
 
         # BUGFIX: Add the narrative text to the Story Log ONLY ONCE
-        clean_log_text = re.sub(r'<[^>]+>', '', text) 
-        self.story_history += f"<br><br>{clean_log_text}"
-        self.log_box.set_text(self.story_history)
-        if self.log_box.scroll_bar:
-            self.log_box.scroll_bar.set_scroll_from_start_percentage(1.0)
+        clean_log_text = HTML_TAG_RE.sub('', text)
+        self._log_frags.append(f"<br><br>{clean_log_text}")
+        self._log_dirty = True
 
         self._display_current_chunk()
 
     def _split_sentences(self, text: str) -> List[str]:
         if not text: return ["..."]
-        sentences = re.findall(r'[^.!?]+[.!?]["”\']?|[^.!?]+$', text.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Strip each sentence once, then drop the empties
+        sentences = [s for s in map(str.strip, SENTENCE_RE.findall(text.strip())) if s]
         if not sentences: return ["..."]
         
-        chunks = []
-        for i in range(0, len(sentences), 3):
-            chunks.append(" ".join(sentences[i:i+3]))
-        return chunks
+        return [" ".join(sentences[i:i + SENTENCES_PER_CHUNK]) for i in range(0, len(sentences), SENTENCES_PER_CHUNK)]
 
     def _display_current_chunk(self):
         if not self.text_chunks: return
         chunk = self.text_chunks[self.current_chunk_idx]
+        self._ui_dirty = True
         
-        # 1. Hard Reset and Visual Lock
-        self.dialogue_box.set_active_effect(None)
+        # Start the typewriter from an empty box; handle_events reveals the chunk
         self.dialogue_box.set_text("")
-        self.dialogue_box.hide()
-        
-        # 2. Pre-Sync: Clear old layout data
-        self.manager.update(0.01)
-        
-        # 3. Layout Initialization: Set text while hidden
-        self.is_typing = True
-        self.dialogue_box.set_text(chunk)
-        
-        # 4. MASK SYNCHRONIZATION
-        # Update multiple times to ensure internal HTML parsing is complete
-        for _ in range(3):
-            self.manager.update(0.01)
-        
-        # 5. Apply Effect to stabilized layout
-        self.dialogue_box.set_active_effect(pygame_gui.TEXT_EFFECT_TYPING_APPEAR, 
-                                          params={'time_per_letter': 0.05})
-        
-        # 6. Final Tick & Reveal
-        self.manager.update(0.01)
-        self.dialogue_box.show()
-        
-        # Ensure we start at the top of long chunks
-        if self.dialogue_box.scroll_bar:
-            self.dialogue_box.scroll_bar.set_scroll_from_start_percentage(0.0)
-        
-        # 4. Apply Effect: Initialize the typewriter mask
-        self.dialogue_box.set_active_effect(pygame_gui.TEXT_EFFECT_TYPING_APPEAR, 
-                                          params={'time_per_letter': 0.05})
-        
-        # 5. TRIPLE-SYNC: Force the engine to process the mask BEFORE revealing
-        # This prevents the 'ghost frame' where the end of the text shows
-        self.manager.update(0.01)
-        self.manager.update(0.01)
-        self.manager.update(0.01)
-        
-        self.dialogue_box.show()
+        self._type_breaks = self._reveal_points(chunk)
+        self._type_pos = 0
+        self._type_accum = 0.0
+        self.is_typing = bool(self._type_breaks)
+        if not self.is_typing:
+            self.dialogue_box.set_text(chunk)
         
         # Ensure we start at the top of long chunks
         if self.dialogue_box.scroll_bar:
             self.dialogue_box.scroll_bar.set_scroll_from_start_percentage(0.0)
 
+    @staticmethod
+    def _reveal_points(chunk: str) -> List[int]:
+        """Returns the slice end after each visible character, skipping over
+        HTML tags and entities so a partial reveal never cuts one in half."""
+        points = []
+        i, n = 0, len(chunk)
+        while i < n:
+            ch = chunk[i]
+            if ch == "<":
+                close = chunk.find(">", i)
+                if close != -1:
+                    i = close + 1
+                    continue
+            elif ch == "&":
+                semi = chunk.find(";", i, i + 10)
+                if semi != -1:
+                    i = semi + 1
+                    points.append(i)
+                    continue
+            i += 1
+            points.append(i)
+        return points
+
+    def _advance_typing(self, time_delta: float):
+        """Reveals the current chunk a letter at a time (typewriter effect)."""
+        if not self.is_typing:
+            return
+        self._type_accum += time_delta
+        steps = int(self._type_accum / TYPE_TIME_PER_LETTER)
+        if not steps:
+            return
+        self._type_accum -= steps * TYPE_TIME_PER_LETTER
+        self._type_pos = min(self._type_pos + steps, len(self._type_breaks))
+        chunk = self.text_chunks[self.current_chunk_idx]
+        self.dialogue_box.set_text(chunk[:self._type_breaks[self._type_pos - 1]])
+        self._ui_dirty = True
+        if self._type_pos >= len(self._type_breaks):
+            self.is_typing = False
+
+    def is_streaming_done(self) -> bool:
+        """True once the last chunk is fully revealed and no further click can advance it."""
+        return not self.is_typing and self.current_chunk_idx >= len(self.text_chunks) - 1
+
     def next_chunk(self) -> bool:
         """Advances to the next text chunk. Returns False if done."""
+        self._ui_dirty = True
         if self.is_typing:
-            self.dialogue_box.set_active_effect(None)
             self.dialogue_box.set_text(self.text_chunks[self.current_chunk_idx])
             self.is_typing = False
             return True
@@ -238,53 +344,114 @@ class VisualNovelUI:
         return False
 
     def append_story_log(self, text: str):
-        self.story_history += f"<br><br><font color='#00ffcc'><b>{text}</b></font>"
-        self.log_box.set_text(self.story_history)
+        self._log_frags.append(f"<br><br><font color='#00ffcc'><b>{text}</b></font>")
+        self._log_dirty = True
+
+    def _flush_log(self):
+        """Pushes the Story Log to its text box if the joined HTML changed."""
+        log_text = LOG_HEADER + "".join(self._log_frags)
+        if log_text == self._log_box_text:
+            return
+        self._log_box_text = log_text
+        self.log_box.set_text(log_text)
         if self.log_box.scroll_bar:
             self.log_box.scroll_bar.set_scroll_from_start_percentage(1.0)
+        self._ui_dirty = True
+
+    def prefetch_background(self, image_path: str):
+        """Starts loading and scaling a background on a worker thread."""
+        if image_path in self._bg_cache or image_path in self._bg_futures:
+            return
+        self._bg_futures[image_path] = self._bg_executor.submit(_load_scaled_image, image_path)
+
+    def _load_bg(self, image_path: str) -> Optional[pygame.Surface]:
+        future = self._bg_futures.pop(image_path, None)
+        try:
+            if future is not None:
+                img = future.result()
+            else:
+                img = _load_scaled_image(image_path)
+            # Pixel-format conversion needs the display, so it stays on the main thread
+            surf = img.convert()
+        except Exception as e:
+            print(f"Error loading background {image_path}: {e}")
+            surf = None
+        self._bg_cache[image_path] = surf
+        return surf
 
     def draw_background(self, image_path: str):
         if image_path != self.current_bg_path:
-            try:
-                img = pygame.image.load(image_path).convert()
-                self.background_image = pygame.transform.scale(img, (WIDTH, HEIGHT))
-                self.current_bg_path = image_path
-            except Exception as e:
-                print(f"Error loading background {image_path}: {e}")
-                self.background_image = None
-        
-        if self.background_image:
-            self.screen.blit(self.background_image, (0, 0))
+            self.current_bg_path = image_path
+            self._ui_dirty = True
+        
+        # The presented frame is still current, so render() will skip this frame too
+        if not self._ui_dirty:
+            return
+        
+        if image_path in self._bg_cache:
+            background = self._bg_cache[image_path]
+        else:
+            background = self._load_bg(image_path)
+        
+        if background:
+            self.screen.blit(background, (0, 0))
         else:
             self.screen.fill((40, 40, 40))
 
     def spawn_floating_notification(self, text: str, color_hex: any = "#00ffcc"):
-        import random
         # Convert RGB tuple to Hex string if necessary for HTML color tag
         if isinstance(color_hex, tuple):
             color_hex = '#%02x%02x%02x' % color_hex
 
-        start_x = (WIDTH - LOG_WIDTH) // 2 + random.randint(-150, 150)
-        start_y = HEIGHT // 2 + random.randint(-100, 50)
+        start_x = self._NOTE_CENTER_X + random.randint(-150, 150)
+        start_y = self._NOTE_CENTER_Y + random.randint(-100, 50)
         
         note = UITextBox(
             html_text=f'<b><font color={color_hex} size=5>{text}</font></b>',
-            relative_rect=pygame.Rect(start_x, start_y, 300, 60),
+            relative_rect=pygame.Rect(start_x, start_y, 300, NOTE_HEIGHT),
             manager=self.manager,
             object_id=ObjectID(class_id="@floating_note")
         )
         note.set_active_effect(pygame_gui.TEXT_EFFECT_FADE_OUT)
         self.floating_notes.append(note)
-
-    def _update_floating_notes(self):
-        for note in self.floating_notes[:]:
-            rect = note.get_relative_rect()
-            note.set_relative_position((rect.x, rect.y - 1))
+        self._note_x.append(start_x)
+        self._note_y.append(float(start_y))
+        self._ui_dirty = True
+
+    def _update_floating_notes(self, time_delta: float):
+        rise = NOTE_RISE_SPEED * time_delta
+        note_x, note_y = self._note_x, self._note_y
+        expired = False
+        for i, note in enumerate(self.floating_notes):
+            old_y = note_y[i]
+            new_y = old_y - rise
+            note_y[i] = new_y
+            if new_y < -NOTE_HEIGHT:
+                expired = True
+            elif int(new_y) != int(old_y):
+                note.set_relative_position((note_x[i], int(new_y)))
+        
+        if expired:
+            # Sweep notes that drifted off-screen before their fade finished
+            keep = [i for i, y in enumerate(note_y) if y >= -NOTE_HEIGHT]
+            for i, note in enumerate(self.floating_notes):
+                if note_y[i] < -NOTE_HEIGHT:
+                    note.kill()
+            self.floating_notes = [self.floating_notes[i] for i in keep]
+            self._note_x = [note_x[i] for i in keep]
+            self._note_y = [note_y[i] for i in keep]
+
+    def _remove_floating_note(self, note: UITextBox):
+        idx = self.floating_notes.index(note)
+        note.kill()
+        del self.floating_notes[idx]
+        del self._note_x[idx]
+        del self._note_y[idx]
 
     def clear_options(self):
-        if self.custom_action_input:
-            self.custom_action_input.kill()
-            self.custom_action_input = None
+        self.custom_action_input.unfocus()
+        self.custom_action_input.hide()
+        self._ui_dirty = True
 
     def display_options(self, options: List[Option]):
         """Injects polished HTML hyperlinks into the dialogue flow."""
@@ -292,20 +459,11 @@ class VisualNovelUI:
         # Use the raw text of the current chunk to avoid duplicating appended links
         current_text = self.text_chunks[self.current_chunk_idx]
         
-        links_html = ""
-        for opt in options:
-            # Clean line breaks for standard options
-            links_html += f'<br><br><a href="{opt.id}">> {opt.text}</a>'
-        
-        # Stylized Custom Action link with soft teal color and italics
-        links_html += (
-            '<br><br>'
-            '<a href="CUSTOM_TRIGGER">'
-            '<font color="#80acaa"><i>> Take Custom Action (Free type)</i></font>'
-            '</a>'
-        )
+        # Clean line breaks for standard options
+        links_html = "".join(f'<br><br><a href="{opt.id}">> {opt.text}</a>' for opt in options)
         
-        self.dialogue_box.set_text(current_text + links_html)
+        self.dialogue_box.set_text(current_text + links_html + CUSTOM_ACTION_LINK)
+        self._ui_dirty = True
         
         if self.dialogue_box.scroll_bar:
             self.dialogue_box.scroll_bar.set_scroll_from_start_percentage(1.0)
@@ -315,74 +473,107 @@ class VisualNovelUI:
         self.selected_choice = None
         current_text = self.dialogue_box.html_text
         
-        end_links = (
-            '<br><br><br>'
-            '<font color="#ff0055">'
-            '<a href="RETRY">RETRY SESSION</a>'
-            '</font>'
-            '<br><br>'
-            '<a href="QUIT">QUIT TO DESKTOP</a>'
-        )
-        
-        self.dialogue_box.set_text(current_text + end_links)
+        self.dialogue_box.set_text(current_text + END_LINKS)
+        self._ui_dirty = True
         if self.dialogue_box.scroll_bar:
             self.dialogue_box.scroll_bar.set_scroll_from_start_percentage(1.0)
 
     def _open_custom_input(self):
-        """Spawns the text entry line centered above the dialogue box."""
-        self.custom_action_input = UITextEntryLine(
-            relative_rect=pygame.Rect(100, HEIGHT - DIALOGUE_HEIGHT - 90, 600, 50),
-            manager=self.manager
-        )
+        """Reveals the text entry line centered above the dialogue box."""
+        self.custom_action_input.set_text("")
+        self.custom_action_input.show()
         self.custom_action_input.focus()
 
-    def handle_events(self) -> Optional[str]:
+    def _on_mouse_down(self, event) -> Optional[str]:
+        if event.button == 1:
+            is_log_click = self._log_rect.collidepoint(event.pos)
+            if not is_log_click:
+                return "CLICKED"
+        return None
+
+    def _on_text_effect_finished(self, event) -> Optional[str]:
+        try:
+            self._remove_floating_note(event.ui_element)
+        except ValueError:
+            pass
+        return None
+
+    def _on_link_clicked(self, event) -> Optional[str]:
+        """Hyperlink interaction logic."""
+        link = event.link_target
+        if link == "CUSTOM_TRIGGER":
+            self._open_custom_input()
+            return None
+        return link
+
+    def _on_text_entry_finished(self, event) -> Optional[str]:
+        if event.ui_element == self.custom_action_input:
+            return event.text
+        return None
+
+    def handle_events(self, idle: bool = False) -> Optional[str]:
+        """Pumps one frame of input.
+
+        Args:
+            idle (bool): The caller is only waiting for input. Unless an animation is
+                running, block on the event queue instead of spinning at full FPS.
+        """
+        events = []
+        if idle and not self.is_typing and not self.floating_notes:
+            first = pygame.event.wait(IDLE_WAIT_MS)
+            if first.type != pygame.NOEVENT:
+                events.append(first)
+        events.extend(pygame.event.get(self._routed_event_types))
+        passthrough = pygame.event.get()
+        
         time_delta = self.clock.tick(FPS) / 1000.0
         result = None
+        had_events = bool(passthrough)
+        
+        # Local aliases keep the per-event dispatch free of module attribute lookups
+        quit_type = pygame.QUIT
+        handlers = self._event_handlers
+        process_events = self.manager.process_events
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in events:
+            had_events = True
+            if event.type == quit_type:
                 return "QUIT"
             
-            self.manager.process_events(event)
+            process_events(event)
             
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    is_log_click = self.log_box.get_relative_rect().collidepoint(event.pos)
-                    if not is_log_click:
-                        result = "CLICKED"
-            
-            if event.type == pygame_gui.UI_TEXT_EFFECT_FINISHED:
-                if event.ui_element == self.dialogue_box:
-                    self.is_typing = False
-                try:
-                    if event.ui_element in self.floating_notes:
-                        event.ui_element.kill()
-                        self.floating_notes.remove(event.ui_element)
-                except ValueError:
-                    pass
-            
-            # Hyperlink interaction logic
-            if event.type == pygame_gui.UI_TEXT_BOX_LINK_CLICKED:
-                link = event.link_target
-                if link == "CUSTOM_TRIGGER":
-                    self._open_custom_input()
-                elif link in ["RETRY", "QUIT"]:
-                    result = link
-                else:
-                    result = link
-            
-            if event.type == pygame_gui.UI_TEXT_ENTRY_FINISHED:
-                if event.ui_element == self.custom_action_input:
-                    result = event.text
-
-        self._update_floating_notes()
-        self.manager.update(time_delta)
+            handler = handlers.get(event.type)
+            if handler is not None:
+                outcome = handler(event)
+                if outcome is not None:
+                    result = outcome
+        
+        for event in passthrough:
+            process_events(event)
+
+        self._update_floating_notes(time_delta)
+        self._advance_typing(time_delta)
+        if self._log_dirty:
+            self._log_dirty = False
+            self._flush_log()
+        
+        # Only tick the whole UI tree every frame while a pygame_gui effect is
+        # running or input arrived; otherwise bank the time and tick at a low rate.
+        # (The typewriter drives set_text itself and needs no manager ticks.)
+        self._idle_accum += time_delta
+        if had_events or self.floating_notes or self._idle_accum >= IDLE_UPDATE_INTERVAL:
+            self.manager.update(self._idle_accum)
+            self._idle_accum = 0.0
+            self._ui_dirty = True
         return result
 
     def render(self):
+        """Draws the UI and flips, skipping frames where nothing has changed."""
+        if not self._ui_dirty:
+            return
         self.manager.draw_ui(self.screen)
         pygame.display.flip()
+        self._ui_dirty = False
 
 # --- Shared Game Loop ---
 def run_game_loop(gm, ui: VisualNovelUI, bg_path: str):
@@ -391,7 +582,8 @@ def run_game_loop(gm, ui: VisualNovelUI, bg_path: str):
         gm.reset_game()
 
         output, _ = gm.run_turn()
-        pygame.event.clear()
+        # Drop only clicks buffered while the turn was generated; other events survive
+        pygame.event.clear([pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP])
 
         while True:
             game_over_msg = gm.check_game_over()
@@ -403,51 +595,37 @@ def run_game_loop(gm, ui: VisualNovelUI, bg_path: str):
             ui.update_hud(gm.state.player)
             ui.show_message(display_output)
 
-            streaming_done = False
-            while not streaming_done:
-                status = ui.handle_events()
-                if status == "QUIT":
-                    pygame.quit()
-                    return
-                if status == "CLICKED":
-                    if not ui.next_chunk():
-                        streaming_done = True
-                ui.draw_background(bg_path)
-                ui.render()
-
-            current_scene = gm.get_current_scene()
-            if game_over_msg or current_scene.is_end:
-                ui.display_end_options()
-                
-                final_choice = None
-                while final_choice not in ["RETRY", "QUIT"]:
-                    final_choice = ui.handle_events()
-                    if final_choice == "QUIT":
-                        pygame.quit()
-                        return
-                    ui.draw_background(bg_path)
-                    ui.render()
-                
-                if final_choice == "RETRY":
-                    break
-                else:
-                    pygame.quit()
-                    return
-
-            ui.display_options(current_scene.options)
-
+            # One event pump and redraw per frame; the phase decides how input is read
+            phase = "STREAM"
+            current_scene = None
             choice = None
             while choice is None:
-                choice = ui.handle_events()
-                if choice == "QUIT":
+                status = ui.handle_events(idle=phase != "STREAM")
+                if status == "QUIT":
                     pygame.quit()
                     return
-                elif choice == "CLICKED":
-                    choice = None
+
+                if phase == "STREAM":
+                    if status == "CLICKED" and (ui.is_streaming_done() or not ui.next_chunk()):
+                        current_scene = gm.get_current_scene()
+                        if game_over_msg or current_scene.is_end:
+                            phase = "END"
+                            ui.display_end_options()
+                        else:
+                            phase = "CHOICE"
+                            ui.display_options(current_scene.options)
+                elif phase == "END":
+                    if status == "RETRY":
+                        choice = status
+                elif status is not None and status != "CLICKED":
+                    choice = status
 
                 ui.draw_background(bg_path)
                 ui.render()
 
+            if phase == "END":
+                break
+
             choice_text = ""
             if choice.isdigit():
                 opt = next((o for o in current_scene.options if str(o.id) == choice), None)
@@ -458,12 +636,14 @@ def run_game_loop(gm, ui: VisualNovelUI, bg_path: str):
             ui.append_story_log(choice_text)
 
             output, _ = gm.run_turn(choice)
-            pygame.event.clear()
+            pygame.event.clear([pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP])
             ui.clear_options()
 
 def main():
     from game_master import GameMaster
     ui = VisualNovelUI()
+    # Decode the background while the theme loads; the first draw picks it up
+    ui.prefetch_background("assets/themes/WasteLand/city3.jpg")
     gm = GameMaster("WasteLand", on_stat_change=ui.spawn_floating_notification)
     ui.play_bgm("assets/themes/WasteLand/bgm1.mp3")
     run_game_loop(gm, ui, "assets/themes/WasteLand/city3.jpg")
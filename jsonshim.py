@@ -0,0 +1,51 @@
+import json
+from typing import Any, Union
+
+# orjson is optional: it parses bytes directly and serializes several times faster,
+# but the engine falls back to the standard library when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parses a JSON document.
+
+    Args:
+        data (Union[bytes, str]): The raw document, typically straight from Path.read_bytes().
+
+    Returns:
+        Any: The decoded object.
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _to_dict(obj: Any) -> Any:
+    """Fallback encoder hook: serializes model dataclasses through their to_dict()."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializes an object to indented UTF-8 JSON.
+
+    Dataclasses may be passed directly: orjson walks them natively, and the
+    stdlib fallback encodes them through their to_dict() method.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        bytes: The encoded document, ready for Path.write_bytes().
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_to_dict).encode("utf-8")
@@ -1,7 +1,22 @@
 import json
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from models import WorldState, Scene, Option, Item, Player
+from jsonshim import loads
+
+# Parsed and validated worlds, keyed by (world path, world mtime, story mtime).
+# Holds (scenes, initial_scene_id, player_stats); Scene objects are never mutated
+# after loading, so callers only need a fresh dict and a fresh Player.
+_WORLD_CACHE: Dict[tuple, tuple] = {}
+
+# Starting stats used when world.json's "player" block omits a field.
+PLAYER_DEFAULTS: Dict[str, int] = {"hp": 100, "mana": 50, "bullet": 5, "credits": 50}
+
+
+def _intern(value: Any) -> Any:
+    """Interns scene ids so id comparisons and dict lookups hit the identity fast path."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class ThemeLoader:
@@ -16,9 +31,21 @@ class ThemeLoader:
         self.theme_path = Path(theme_path)
         self.world_file = self.theme_path / "world.json"
 
-    def load_world(self) -> WorldState:
+    def load_all(self) -> Tuple[WorldState, Dict[str, Any], List[Dict[str, Any]]]:
+        """Loads the world, story and events of the theme, parsing story.json only once.
+
+        Returns:
+            Tuple[WorldState, Dict[str, Any], List[Dict[str, Any]]]: The world state, story data and raw triggers.
+        """
+        story_data = self.load_story()
+        return self.load_world(story_data), story_data, self.load_events()
+
+    def load_world(self, story_data: Optional[Dict[str, Any]] = None) -> WorldState:
         """Parses world.json and returns an initialized WorldState.
 
+        Args:
+            story_data (Optional[Dict[str, Any]]): Already parsed story.json; loaded on demand if omitted.
+
         Returns:
             WorldState: The validated world state.
 
@@ -29,40 +56,51 @@ class ThemeLoader:
         if not self.world_file.exists():
             raise FileNotFoundError(f"Missing required world file: {self.world_file}")
 
+        story_file = self.theme_path / "story.json"
+        cache_key = None
+        if story_file.exists():
+            cache_key = (
+                str(self.world_file),
+                self.world_file.stat().st_mtime_ns,
+                story_file.stat().st_mtime_ns,
+            )
+            cached = _WORLD_CACHE.get(cache_key)
+            if cached is not None:
+                scenes, initial_id, player_stats = cached
+                return WorldState(scenes=dict(scenes), player=Player(current_scene_id=initial_id, **player_stats))
+
         # Load story data for script references
-        story_data = self.load_story()
+        if story_data is None:
+            story_data = self.load_story()
         scripts = story_data.get("scripts", {})
 
-        with self.world_file.open("r") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Malformed JSON in {self.world_file}: {e}")
+        try:
+            data = loads(self.world_file.read_bytes())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed JSON in {self.world_file}: {e}")
 
-        # 1. Parse Scenes
+        # 1. Parse Scenes, collecting (scene_id, option_id, target) for one validation pass
         scenes: Dict[str, Scene] = {}
+        pending_exits: List[tuple] = []
         for scene_id, scene_data in data.get("scenes", {}).items():
+            scene_id = _intern(scene_id)
             # Narrative text lookup
             story_ref = scene_data.get("story_ref")
             if not story_ref:
                 raise ValueError(f"Scene '{scene_id}' is missing a 'story_ref'.")
             
-            if story_ref not in scripts:
+            scene_text = scripts.get(story_ref)
+            if scene_text is None:
                 raise ValueError(
                     f"Validation Error: Scene '{scene_id}' references story_ref '{story_ref}', "
                     f"but it was not found in story.json scripts."
                 )
-            
-            scene_text = scripts[story_ref]
 
             options = [
-                Option(
-                    id=opt.get("id"),
-                    text=opt.get("text"),
-                    next_scene_id=opt.get("next_scene_id")
-                )
+                Option(opt.get("id"), opt.get("text"), _intern(opt.get("next_scene_id")))
                 for opt in scene_data.get("options", [])
             ]
+            pending_exits.extend((scene_id, opt.id, opt.next_scene_id) for opt in options)
             scenes[scene_id] = Scene(
                 id=scene_id,
                 text=scene_text,
@@ -71,30 +109,26 @@ class ThemeLoader:
             )
 
         # 2. Validation: Check if all next_scene_id exist
-        for scene_id, scene in scenes.items():
-            for option in scene.options:
-                if option.next_scene_id not in scenes:
+        if not {target for _, _, target in pending_exits} <= scenes.keys():
+            for scene_id, option_id, target in pending_exits:
+                if target not in scenes:
                     raise ValueError(
-                        f"Validation Error: Scene '{scene_id}' has an option '{option.id}' "
-                        f"leading to non-existent scene '{option.next_scene_id}'."
+                        f"Validation Error: Scene '{scene_id}' has an option '{option_id}' "
+                        f"leading to non-existent scene '{target}'."
                     )
 
         # 3. Validation: Initial scene check
-        initial_id = data.get("initial_scene_id")
+        initial_id = _intern(data.get("initial_scene_id"))
         if not initial_id or initial_id not in scenes:
             raise ValueError(f"Invalid or missing initial_scene_id: '{initial_id}'")
 
         # 4. Initialize Player
         player_data = data.get("player", {})
-        player = Player(
-            current_scene_id=initial_id,
-            hp=player_data.get("hp", 100),
-            mana=player_data.get("mana", 50),
-            bullet=player_data.get("bullet", 5),
-            credits=player_data.get("credits", 50)
-        )
+        player_stats = {stat: player_data.get(stat, default) for stat, default in PLAYER_DEFAULTS.items()}
+        if cache_key is not None:
+            _WORLD_CACHE[cache_key] = (scenes, initial_id, player_stats)
 
-        return WorldState(scenes=scenes, player=player)
+        return WorldState(scenes=dict(scenes), player=Player(current_scene_id=initial_id, **player_stats))
 
     def load_story(self) -> Dict[str, Any]:
         """Parses story.json from the theme folder.
@@ -106,11 +140,10 @@ class ThemeLoader:
         if not story_file.exists():
             raise FileNotFoundError(f"Missing required story file: {story_file}")
 
-        with story_file.open("r") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Malformed JSON in {story_file}: {e}")
+        try:
+            return loads(story_file.read_bytes())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed JSON in {story_file}: {e}")
 
     def load_events(self) -> List[Dict[str, Any]]:
         """Parses events.json from the theme folder.
@@ -122,9 +155,8 @@ class ThemeLoader:
         if not events_file.exists():
             return []
 
-        with events_file.open("r") as f:
-            try:
-                data = json.load(f)
-                return data.get("triggers", [])
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Malformed JSON in {events_file}: {e}")
+        try:
+            data = loads(events_file.read_bytes())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed JSON in {events_file}: {e}")
+        return data.get("triggers", [])
@@ -1,8 +1,8 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Option:
     """A choice available in a scene.
 
@@ -15,8 +15,11 @@ class Option:
     text: str
     next_scene_id: str
 
+    def to_dict(self) -> dict:
+        return {"id": self.id, "text": self.text, "next_scene_id": self.next_scene_id}
+
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     """A narrative node in the game world (Visual Novel style).
 
@@ -35,15 +38,28 @@ class Scene:
     reached_target_plot: bool = False
     stat_changes: Dict[str, int] = field(default_factory=lambda: {"hp": 0, "mana": 0, "bullet": 0, "credits": 0})
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "text": self.text,
+            "is_end": self.is_end,
+            "options": [opt.to_dict() for opt in self.options],
+            "reached_target_plot": self.reached_target_plot,
+            "stat_changes": dict(self.stat_changes),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """An item that can be picked up or used in the game."""
     name: str
     description: str
 
+    def to_dict(self) -> dict:
+        return {"name": self.name, "description": self.description}
+
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """The player character and their current state.
 
@@ -63,10 +79,17 @@ class Player:
     credits: int = 50
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "current_scene_id": self.current_scene_id,
+            "inventory": [item.to_dict() for item in self.inventory],
+            "hp": self.hp,
+            "mana": self.mana,
+            "bullet": self.bullet,
+            "credits": self.credits,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldState:
     """The isolated state of the game world.
 
@@ -78,10 +101,13 @@ class WorldState:
     player: Player
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "scenes": {scene_id: scene.to_dict() for scene_id, scene in self.scenes.items()},
+            "player": self.player.to_dict(),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class GameContext:
     """Tracks global session-specific state.
 
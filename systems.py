@@ -1,4 +1,4 @@
-import json
+import atexit
 import time
 import os
 import random
@@ -6,9 +6,11 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from models import WorldState, Player
+from jsonshim import dumps
+from loader import PLAYER_DEFAULTS, _intern
 
 
-@dataclass
+@dataclass(slots=True)
 class Trigger:
     """Defines a deterministic or probabilistic game event.
 
@@ -33,19 +35,40 @@ class EventManager:
 
     def __init__(self):
         self.triggers: List[Trigger] = []
+        # Per scene_id: prebuilt events of certain triggers, and triggers that need a roll.
+        self._always: Dict[str, List[Tuple[Dict[str, Any], str]]] = {}
+        self._maybe: Dict[str, List[Trigger]] = {}
 
     def load_triggers(self, trigger_data: List[Dict[str, Any]]):
-        """Loads trigger definitions from raw data."""
+        """Loads trigger definitions from raw data.
+
+        Raises:
+            ValueError: If a trigger's result changes a stat the Player does not have.
+        """
         self.triggers = []
+        self._always = {}
+        self._maybe = {}
         for data in trigger_data:
-            self.triggers.append(Trigger(
+            trigger = Trigger(
                 event_id=data["event_id"],
-                trigger_type=data["trigger_type"],
-                condition=data["condition"],
+                trigger_type=_intern(data["trigger_type"]),
+                condition=_intern(data["condition"]),
                 probability=data.get("probability", 1.0),
                 narrative_description=data["narrative_description"],
                 result=data.get("result", {})
-            ))
+            )
+            unknown = trigger.result.keys() - PLAYER_DEFAULTS.keys()
+            if unknown:
+                raise ValueError(
+                    f"Validation Error: Trigger '{trigger.event_id}' changes unknown stat(s) "
+                    f"{sorted(unknown)}; expected any of {list(PLAYER_DEFAULTS)}."
+                )
+            self.triggers.append(trigger)
+            if trigger.probability >= 1.0:
+                self._always.setdefault(trigger.condition, []).append(
+                    (trigger.result, trigger.narrative_description))
+            else:
+                self._maybe.setdefault(trigger.condition, []).append(trigger)
 
     def check_triggers(self, scene_id: str) -> List[Tuple[Dict[str, Any], str]]:
         """Checks for matching triggers for a specific scene.
@@ -53,17 +76,19 @@ class EventManager:
         Returns:
             List[Tuple[Dict[str, Any], str]]: A list of (result, description) for fired events.
         """
-        fired_events = []
-        for t in self.triggers:
-            if t.condition == scene_id:
-                if random.random() <= t.probability:
-                    fired_events.append((t.result, t.narrative_description))
+        fired_events = list(self._always.get(scene_id, ()))
+        for t in self._maybe.get(scene_id, ()):
+            if random.random() <= t.probability:
+                fired_events.append((t.result, t.narrative_description))
         return fired_events
 
 
 class NarrativeLogger:
     """Handles human-readable session logging."""
 
+    # Entries written between hand-offs of the buffer to the OS (no fsync until close).
+    FLUSH_EVERY = 16
+
     def __init__(self, log_dir: str = "logs"):
         """Initializes the logger and creates a new session file.
 
@@ -76,11 +101,13 @@ class NarrativeLogger:
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         self.file_path = self.log_dir / f"session_{timestamp}.txt"
         
-        # Ensure the file is created
-        self.file_path.touch()
+        # One buffered handle for the whole session; fsync happens only on close.
+        self._fh = self.file_path.open("a", encoding="utf-8", buffering=8192)
+        self._pending = 0
+        atexit.register(self.close)
 
     def log(self, role: str, text: str):
-        """Appends a line to the narrative log and flushes the buffer.
+        """Appends a line to the narrative log.
 
         Args:
             role (str): The entity speaking/acting (e.g., 'PLAYER', 'SYSTEM').
@@ -93,15 +120,26 @@ class NarrativeLogger:
         else:
             entry = f"Scene Description: {text.strip()}\n"
         
-        with self.file_path.open("a", encoding="utf-8") as f:
-            f.write(entry)
-            f.flush()
-            os.fsync(f.fileno())
+        self._fh.write(entry)
+        self._pending += 1
+        if self._pending >= self.FLUSH_EVERY:
+            self._fh.flush()
+            self._pending = 0
 
     def reset_game(self):
         """Wipes the current session log file."""
-        with self.file_path.open("w", encoding="utf-8") as f:
-            f.truncate(0)
+        self._fh.flush()
+        self._fh.seek(0)
+        self._fh.truncate()
+        self._pending = 0
+
+    def close(self):
+        """Flushes the log to disk and closes the session file. Safe to call twice."""
+        if self._fh.closed:
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._fh.close()
 
 
 class MemoryManager:
@@ -136,8 +174,14 @@ class MemoryManager:
         """Clears interaction history and wipes the memory.json file."""
         self.history_window = []
         if self.save_path.exists():
-            with self.save_path.open("w", encoding="utf-8") as f:
-                json.dump({}, f)
+            self._write_atomic(self.save_path, dumps({}))
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Writes data to a sibling temp file and swaps it in, so readers never see a torn file."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
 
     def save_snapshot(self, player: Player, current_scene_id: str, recent_history: List[Dict[str, str]], turn_count: int = 0):
         """Saves a compressed memory.json for AI consumption.
@@ -162,8 +206,7 @@ class MemoryManager:
             "timestamp": time.time()
         }
 
-        with self.save_path.open("w", encoding="utf-8") as f:
-            json.dump(compressed_memory, f, indent=2)
+        self._write_atomic(self.save_path, dumps(compressed_memory))
 
     def save_context(self, state: WorldState):
         """Saves a compressed memory.json for AI consumption (Legacy/Internal)."""
@@ -177,10 +220,9 @@ class MemoryManager:
         """
         snapshot_path = self.save_path.parent / "state_snapshot.json"
         snapshot = {
-            "state": state.to_dict(),
+            "state": state,
             "history_window": self.history_window,
             "timestamp": time.time()
         }
         
-        with snapshot_path.open("w", encoding="utf-8") as f:
-            json.dump(snapshot, f, indent=2)
+        self._write_atomic(snapshot_path, dumps(snapshot))